@@ -1,27 +1,154 @@
 from PIL import Image
 import numpy as np
+import struct
 import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+# the fused 2-color kernel comes in three flavors, best first: the
+# ahead-of-time Cython extension (no JIT warm-up; build with
+# `python setup_dither.py build_ext --inplace`), the numba JIT, and the
+# plain NumPy path below
+try:
+    from _dither import dither_2color as _dither_2color_c
+    HAS_CDITHER = True
+except ImportError:
+    HAS_CDITHER = False
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
-# ---------- DITHERING CORE ----------
+# pyvips is optional too: it fuses decode + grayscale + resize into one
+# streaming pipeline, which dominates on large source images
+try:
+    import pyvips
+    HAS_PYVIPS = True
+except ImportError:
+    HAS_PYVIPS = False
 
-def bayer_matrix(n: int) -> np.ndarray:
-    """Generate an n x n Bayer (ordered dither) matrix. n must be a power of 2."""
-    if n == 1:
-        return np.array([[0]], dtype=np.float32)
 
-    m2 = bayer_matrix(n // 2)
 
-    tl = 4 * m2
-    tr = 4 * m2 + 2
-    bl = 4 * m2 + 3
-    br = 4 * m2 + 1
+# ---------- DITHERING CORE ----------
 
-    top = np.concatenate((tl, tr), axis=1)
-    bottom = np.concatenate((bl, br), axis=1)
-    return np.concatenate((top, bottom), axis=0)
+@lru_cache(maxsize=8)
+def bayer_matrix(n: int) -> np.ndarray:
+    """Generate an n x n Bayer (ordered dither) matrix. n must be a power of 2.
+
+    Closed-form bit-twiddle over a coordinate grid: each coordinate bit
+    pair contributes two value bits ((x^y, y), finest level most
+    significant). Same matrix the old recursive concatenate build
+    produced, without the log2(n) rounds of temporary allocations.
+
+    Cached (and returned read-only, since callers share the instance):
+    the derived LUT/threshold helpers each call this once per size.
+    """
+    y, x = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    v = np.zeros((n, n), dtype=np.int64)
+    for k in range(n.bit_length() - 1):
+        v = (v << 2) | ((((x >> k) ^ (y >> k)) & 1) << 1) | ((y >> k) & 1)
+    v = v.astype(np.float32)
+    v.setflags(write=False)
+    return v
+
+
+@lru_cache(maxsize=4)
+def _tone_lut(gamma: float, cutoff: float) -> np.ndarray:
+    """256-entry LUT folding the gamma curve and shadow remap.
+
+    Input is uint8, so the whole tonal-shaping stage collapses to one
+    indexed gather instead of pow/subtract/divide/clip over every pixel.
+    Deep shadows get the sentinel -1 so callers can spot them cheaply.
+    """
+    g = np.arange(256, dtype=np.float32)
+    g /= 255.0
+    np.power(g, np.float32(gamma), out=g)
+    shadows = g < cutoff
+    np.subtract(g, cutoff, out=g)
+    np.divide(g, 1.0 - cutoff, out=g)
+    np.clip(g, 0.0, 1.0, out=g)
+    g[shadows] = -1.0
+    return g
+
+
+@lru_cache(maxsize=4)
+def _tone_lut_q(gamma: float, cutoff: float, n: int) -> np.ndarray:
+    """Tone LUT quantized to integer Bayer ranks for the 2-color path.
+
+    Maps a byte to floor(g * n^2 + 0.5) with deep shadows pinned to 0,
+    which sits below every threshold in _bayer_thresholds -- so one
+    integer compare covers both the dither and the shadow cutoff.
+    Exactly matches the float comparison:
+    g >= (B + 0.5) / n^2  <=>  floor(g * n^2 + 0.5) >= B + 1.
+    """
+    lut = _tone_lut(gamma, cutoff)
+    q = np.floor(lut * (n * n) + 0.5).astype(np.int32)
+    q[lut < 0] = 0
+    return q.astype(np.uint8 if n * n < 256 else np.uint16)
+
+
+@lru_cache(maxsize=16)
+def _norm_bayer(n: int) -> np.ndarray:
+    """Normalized (0..1) Bayer matrix, cached so batch runs build it once."""
+    M = bayer_matrix(n)
+    return ((M + 0.5) / (n * n)).astype(np.float32)
+
+
+@lru_cache(maxsize=4)
+def _level_lut(gamma: float, cutoff: float, levels: int, n: int) -> np.ndarray:
+    """Tone LUT pre-scaled for integer N-color dithering.
+
+    Maps a byte to floor(vals * levels * n^2 + 0.5) with shadows pinned
+    to 0, so that (lut[p] + bayer_rank) >> log2(n^2) is the dithered
+    level index -- the whole float floor/clip chain folded into an add
+    and a shift.
+    """
+    lut = _tone_lut(gamma, cutoff)
+    vals = np.clip(lut, 0.0, 0.9999).astype(np.float64)
+    q = np.floor(vals * levels * (n * n) + 0.5).astype(np.uint16)
+    q[lut < 0] = 0
+    return q
+
+
+@lru_cache(maxsize=16)
+def _bayer_u16(n: int) -> np.ndarray:
+    """Raw integer Bayer ranks 0..n*n-1, counterpart of _level_lut."""
+    return bayer_matrix(n).astype(np.uint16)
+
+
+@lru_cache(maxsize=16)
+def _bayer_thresholds(n: int) -> np.ndarray:
+    """Integer Bayer thresholds 1..n*n, counterpart of _tone_lut_q."""
+    return (bayer_matrix(n) + 1).astype(
+        np.uint8 if n * n < 256 else np.uint16)
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _dither_kernel(gray_u8, bayer, gamma, cutoff, out):
+        """Fused gamma + shadow + ordered dither (2 colors, index output).
+
+        One pass over the image instead of a chain of full-size NumPy
+        temporaries; rows are dithered in parallel. n must be a power of 2
+        so `& (n - 1)` replaces the tiled matrix lookup. Writes palette
+        indices (0 = background, 1 = foreground) for the indexed PNG
+        writer.
+        """
+        h, w = gray_u8.shape
+        n = bayer.shape[0]
+        for y in prange(h):
+            brow = bayer[y & (n - 1)]
+            for x in range(w):
+                g = (gray_u8[y, x] / 255.0) ** gamma
+                if g < cutoff:
+                    out[y, x] = 0
+                else:
+                    v = (g - cutoff) / (1.0 - cutoff)
+                    out[y, x] = 1 if v >= brow[x & (n - 1)] else 0
 
 # Named color palettes: (background_color, foreground_color)
 PALETTES = {
@@ -43,89 +170,236 @@ PALETTES = {
 
 
 
+# per-process scratch buffers, reused across a batch while images keep
+# the same shape (always true when target_width is set) -- saves the
+# multi-megabyte allocate/free churn per image
+_scratch: dict = {}
+
+
+def _scratch_buf(name: str, shape, dtype) -> np.ndarray:
+    buf = _scratch.get(name)
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        buf = _scratch[name] = np.empty(shape, dtype)
+    return buf
+
+
+@lru_cache(maxsize=8)
+def _threshold_band(n: int, w: int) -> np.ndarray:
+    """2-color threshold band (n rows x image width), keyed by shape.
+
+    Batches usually share a width (always true when target_width is
+    set), so the tile across the width happens once per shape instead
+    of once per image. Cached per process; marked read-only since
+    callers share it.
+    """
+    band = np.tile(_bayer_thresholds(n), (1, w // n + 1))[:, :w]
+    band.setflags(write=False)
+    return band
+
+
+@lru_cache(maxsize=8)
+def _rank_band(n: int, w: int) -> np.ndarray:
+    """N-color Bayer rank band, shape-keyed like _threshold_band."""
+    band = np.tile(_bayer_u16(n), (1, w // n + 1))[:, :w]
+    band.setflags(write=False)
+    return band
+
+
+def _load_gray(input_path: str, target_width: int | None) -> np.ndarray:
+    """Decode an image to a uint8 grayscale array, resized to target_width.
+
+    With pyvips installed the decoder, grayscale conversion and resize run
+    as one streaming pipeline with no full-size intermediate; otherwise we
+    fall back to the PIL decode + LANCZOS resize path.
+    """
+    if HAS_PYVIPS:
+        v = pyvips.Image.new_from_file(input_path, access="sequential")
+        v = v.colourspace("b-w")[0]
+        if target_width is not None:
+            scale = target_width / v.width
+            v = v.resize(scale, vscale=int(v.height * scale) / v.height)
+        return np.ndarray(buffer=v.write_to_memory(), dtype=np.uint8,
+                          shape=(v.height, v.width))
+
+    img = Image.open(input_path)
+    new_size = None
+    if target_width is not None:
+        w, h = img.size
+        new_size = (target_width, int(h * (target_width / w)))
+        # for JPEGs this makes libjpeg decode grayscale at 1/2..1/8
+        # scale during the IDCT instead of decoding full size first;
+        # a no-op for other formats
+        img.draft("L", new_size)
+    img = img.convert("L")
+    if new_size is not None and img.size != new_size:
+        img = img.resize(new_size, Image.LANCZOS)
+    return np.asarray(img, dtype=np.uint8)
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return (struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data)))
+
+
+def _render_params(palette_name: str, matrix_size: int,
+                   target_width: int | None) -> str:
+    """Settings fingerprint stored in the output PNG for skip checks."""
+    return f"{palette_name},{matrix_size},{target_width}"
+
+
+def _png_params(path) -> str | None:
+    """Read back the params fingerprint from a PNG we wrote earlier.
+
+    Scans the chunk headers only (the tEXt chunk sits before the pixel
+    data), so the check costs one small read, not a decode.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read(8) != b"\x89PNG\r\n\x1a\n":
+                return None
+            while True:
+                head = f.read(8)
+                if len(head) < 8:
+                    return None
+                length, tag = struct.unpack(">I4s", head)
+                if tag == b"tEXt":
+                    keyword, _, value = f.read(length).partition(b"\x00")
+                    if keyword == b"raster":
+                        return value.decode("latin-1")
+                    f.seek(4, 1)
+                    continue
+                if tag == b"IDAT":
+                    return None
+                f.seek(length + 4, 1)
+    except OSError:
+        return None
+
+
+def _save_png(indices: np.ndarray, palette, output_path: str,
+              params: str | None = None):
+    """Minimal indexed PNG writer for the (h, w) uint8 index maps here.
+
+    The output never has more colors than the palette, so write color
+    type 3: 1 byte per pixel through deflate instead of 3, with the
+    palette in a PLTE chunk. Skips PIL's per-row filter heuristics
+    entirely: filter 0 on every row, one IDAT, zlib level 1 with Z_RLE
+    -- dithered output is extremely run-friendly, so RLE encodes it
+    fast at comparable size. Writes go through a 1 MiB buffer so batch
+    runs don't flush in small chunks.
+    """
+    h, w = indices.shape
+
+    # scanlines with the filter byte (0 = none) prepended to each row
+    raw = _scratch_buf("raw", (h, 1 + w), np.uint8)
+    raw[:, 0] = 0
+    raw[:, 1:] = indices
+
+    comp = zlib.compressobj(1, zlib.DEFLATED, 15, 8, zlib.Z_RLE)
+    idat = comp.compress(raw.tobytes()) + comp.flush()
+
+    ihdr = struct.pack(">IIBBBBB", w, h, 8, 3, 0, 0, 0)  # 8-bit indexed
+    plte = bytes(c for color in palette for c in color)
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", ihdr))
+        f.write(_png_chunk(b"PLTE", plte))
+        if params is not None:
+            f.write(_png_chunk(
+                b"tEXt", b"raster\x00" + params.encode("latin-1")))
+        f.write(_png_chunk(b"IDAT", idat))
+        f.write(_png_chunk(b"IEND", b""))
+
+
 def rasterize(input_path: str,
               output_path: str,
               palette_name: str = "vt320",
               matrix_size: int = 8,
               target_width: int | None = None):
     """Process a single image file."""
-    img = Image.open(input_path).convert("L")
-
-    # optional resize
-    if target_width is not None:
-        w, h = img.size
-        new_h = int(h * (target_width / w))
-        img = img.resize((target_width, new_h), Image.LANCZOS)
-
-    w, h = img.size
-    gray = np.array(img, dtype=np.float32) / 255.0  # values 0..1
+    gray_u8 = _load_gray(input_path, target_width)
+    h, w = gray_u8.shape
 
     # --- tonal shaping to get solid dark silhouettes ---
 
     gamma = 1.1          # slight contrast tweak
     shadow_cutoff = 0.28 # anything below this becomes pure background
 
-    # apply gamma curve
-    gray_lin = np.power(gray, gamma)
-
-    # mark deep shadows
-    shadows = gray_lin < shadow_cutoff
-
-    # rescale the remaining range back to 0..1
-    gray_scaled = (gray_lin - shadow_cutoff) / (1.0 - shadow_cutoff)
-    gray_scaled = np.clip(gray_scaled, 0.0, 1.0)
-
-    # --- Bayer matrix tiled across the image ---
-
-    M = bayer_matrix(matrix_size)
-    M = (M + 0.5) / (matrix_size * matrix_size)     # normalize 0..1
-    tiled = np.tile(M, (h // matrix_size + 1, w // matrix_size + 1))
-    tiled = tiled[:h, :w]
-
-    # primary dither mask using the adjusted gray
-    mask = gray_scaled >= tiled
+    colors = PALETTES[palette_name]
 
-    # force deep shadows to be background only
-    mask[shadows] = False
+    # fast path: fused compiled kernel for 2-color palettes
+    if (HAS_CDITHER or HAS_NUMBA) and len(colors) == 2:
+        indices = _scratch_buf("indices", (h, w), np.uint8)
+        if HAS_CDITHER:
+            _dither_2color_c(gray_u8, _norm_bayer(matrix_size),
+                             gamma, shadow_cutoff, indices)
+        else:
+            _dither_kernel(gray_u8, _norm_bayer(matrix_size),
+                           gamma, shadow_cutoff, indices)
+        _save_png(indices, colors, output_path,
+                  _render_params(palette_name, matrix_size, target_width))
+        print(f"Saved {output_path} ({w}x{h}, palette={palette_name})")
+        return
 
     # --- apply palette to build RGB image ---
 
-       # --- map to palette colors ---
-
-    colors = PALETTES[palette_name]
+    # Thresholds are tiled only as a band of matrix_size rows across the
+    # width; full-height tiling comes for free by viewing the image as
+    # (blocks, n, w) and letting broadcasting repeat the band -- no
+    # H x W threshold array. The remainder rows (if any) get a cropped
+    # band.
+    n = matrix_size
+    h2 = h - h % n
 
     # 2-color case (what you already had)
     if len(colors) == 2:
-        bg, fg = colors
-        rgb = np.zeros((h, w, 3), dtype=np.uint8)
-
-        # binary dither mask
-        mask = gray_scaled >= tiled
-        mask[shadows] = False  # deep shadows forced to background
-
-        rgb[mask] = fg
-        rgb[~mask] = bg
+        # stay in uint8: quantized gray vs integer Bayer ranks, so the
+        # compare streams a quarter of the bytes the float path did
+        lut_q = _tone_lut_q(gamma, shadow_cutoff, n)
+        if lut_q.dtype == np.uint8:
+            # PIL's C point loop runs a byte LUT ~4x faster than a
+            # NumPy fancy-index gather (fromarray is a zero-copy view)
+            gray_q = np.asarray(
+                Image.fromarray(gray_u8).point(lut_q.tolist(), "L"))
+        else:
+            gray_q = lut_q[gray_u8]
+        thr_q = _threshold_band(n, w)
+
+        # binary dither mask (shadows quantize to 0 and always lose)
+        mask = _scratch_buf("mask", (h, w), np.bool_)
+        np.greater_equal(gray_q[:h2].reshape(-1, n, w), thr_q,
+                         out=mask[:h2].reshape(-1, n, w))
+        if h2 < h:
+            np.greater_equal(gray_q[h2:], thr_q[:h - h2], out=mask[h2:])
+
+        # the boolean mask already is the palette-index map (0 = bg,
+        # 1 = fg); no RGB expansion needed for indexed output
+        indices = mask.view(np.uint8)
 
     else:
         # N-color ordered dither (for DMG etc.)
         L = len(colors)
 
-        # normalize gray into [0, 1) to avoid hitting L exactly
-        vals = np.clip(gray_scaled, 0.0, 0.9999)
-
-        # ordered-dithered level index 0..L-1
-        levels = np.floor(vals * L + tiled).astype(np.int32)
-        levels = np.clip(levels, 0, L - 1)
-
-        # deep shadows always use color 0 (darkest)
-        levels[shadows] = 0
-
-        rgb = np.zeros((h, w, 3), dtype=np.uint8)
-        for idx, color in enumerate(colors):
-            rgb[levels == idx] = color
-
-    out = rgb
-    Image.fromarray(out, mode="RGB").save(output_path)
+        # integer-domain dither: pre-scaled tone LUT + raw Bayer rank,
+        # one add and one shift -- no float temporaries. Shadows map to
+        # 0 in the LUT and shift down to level 0 (darkest) by themselves.
+        gray_q = _scratch_buf("gray_q", (h, w), np.uint16)
+        np.take(_level_lut(gamma, shadow_cutoff, L, n), gray_u8, out=gray_q)
+        thr_q = _rank_band(n, w)
+
+        levels = _scratch_buf("levels", (h, w), np.uint16)
+        np.add(gray_q[:h2].reshape(-1, n, w), thr_q,
+               out=levels[:h2].reshape(-1, n, w))
+        if h2 < h:
+            np.add(gray_q[h2:], thr_q[:h - h2], out=levels[h2:])
+        levels >>= (n * n - 1).bit_length()  # log2(n^2); n is a power of 2
+        np.minimum(levels, L - 1, out=levels)
+
+        # level indices map straight onto the PLTE palette
+        indices = _scratch_buf("indices", (h, w), np.uint8)
+        np.copyto(indices, levels, casting="unsafe")
+
+    _save_png(indices, colors, output_path,
+              _render_params(palette_name, matrix_size, target_width))
     print(f"Saved {output_path} ({w}x{h}, palette={palette_name})")
 
 
@@ -135,7 +409,14 @@ def process_folder(input_dir: str,
                    output_dir: str,
                    palette_name: str = "vt320",
                    target_width: int | None = None,
-                   matrix_size: int = 8):
+                   matrix_size: int = 8,
+                   on_progress=None):
+    """Rasterize every image in input_dir.
+
+    on_progress, if given, is called as on_progress(filename, done, total)
+    after each image finishes (from this process, so GUI callers can
+    marshal it onto their event loop).
+    """
     in_path = Path(input_dir)
     out_path = Path(output_dir)
 
@@ -148,6 +429,7 @@ def process_folder(input_dir: str,
     # extensions we’ll treat as images
     exts = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif"}
 
+    jobs = []
     for file in sorted(in_path.iterdir()):
         if not file.is_file():
             continue
@@ -158,14 +440,39 @@ def process_folder(input_dir: str,
         output_name = f"{file.stem}_{palette_name}.png"
         output_path = out_path / output_name
 
+        # skip outputs that are newer than their input and were made
+        # with the same settings (fingerprint lives in the PNG itself)
+        if (output_path.exists()
+                and output_path.stat().st_mtime >= file.stat().st_mtime
+                and _png_params(output_path) == _render_params(
+                    palette_name, matrix_size, target_width)):
+            print(f"Skipping {file.name} (up to date)")
+            continue
+
         print(f"Processing {file.name} -> {output_name}")
-        rasterize(
-            str(file),
-            str(output_path),
-            palette_name=palette_name,
-            matrix_size=matrix_size,
-            target_width=target_width,
-        )
+        jobs.append((str(file), str(output_path)))
+
+    kwargs = dict(palette_name=palette_name,
+                  matrix_size=matrix_size,
+                  target_width=target_width)
+
+    total = len(jobs)
+
+    if total <= 1:
+        for done, (src, dst) in enumerate(jobs, 1):
+            rasterize(src, dst, **kwargs)
+            if on_progress is not None:
+                on_progress(Path(src).name, done, total)
+        return
+
+    # images are independent, so fan them out one worker per core
+    with ProcessPoolExecutor() as ex:
+        futures = {ex.submit(rasterize, src, dst, **kwargs): src
+                   for src, dst in jobs}
+        for done, future in enumerate(as_completed(futures), 1):
+            future.result()  # re-raise any worker error here
+            if on_progress is not None:
+                on_progress(Path(futures[future]).name, done, total)
 
 # ---------- COMMAND LINE INTERFACE ----------
 
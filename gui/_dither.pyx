@@ -0,0 +1,40 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+# cython: language_level=3
+"""Ahead-of-time compiled 2-color dither kernel.
+
+Same fused gamma + shadow + ordered-dither pass as the numba kernel in
+rasterize.py, but compiled once at install time -- no JIT warm-up on
+first use, which matters for GUI cold start. Rows run in parallel via
+OpenMP with the GIL released; the inner uint8 compare auto-vectorizes.
+
+Build in place with:
+
+    python setup_dither.py build_ext --inplace
+"""
+from cython.parallel cimport prange
+from libc.math cimport pow
+
+
+def dither_2color(const unsigned char[:, ::1] gray,
+                  const float[:, ::1] bayer,
+                  double gamma, double cutoff,
+                  unsigned char[:, ::1] out):
+    """Write palette indices (0 = bg, 1 = fg) for a uint8 gray image.
+
+    bayer is the normalized (0..1) matrix; its size must be a power of
+    two so `& (n - 1)` replaces a tiled lookup.
+    """
+    cdef Py_ssize_t h = gray.shape[0]
+    cdef Py_ssize_t w = gray.shape[1]
+    cdef int m = <int>bayer.shape[0] - 1
+    cdef Py_ssize_t x, y
+    cdef double g, v
+
+    for y in prange(h, nogil=True, schedule='static'):
+        for x in range(w):
+            g = pow(gray[y, x] / 255.0, gamma)
+            if g < cutoff:
+                out[y, x] = 0
+            else:
+                v = (g - cutoff) / (1.0 - cutoff)
+                out[y, x] = 1 if v >= bayer[y & m, x & m] else 0
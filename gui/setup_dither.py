@@ -0,0 +1,20 @@
+"""Build the optional C dither kernel:
+
+    python setup_dither.py build_ext --inplace
+
+Needs Cython and a C compiler with OpenMP. rasterize.py falls back to
+numba or plain NumPy when the extension is not built.
+"""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    ext_modules=cythonize([
+        Extension(
+            "_dither",
+            ["_dither.pyx"],
+            extra_compile_args=["-O3", "-fopenmp"],
+            extra_link_args=["-fopenmp"],
+        )
+    ]),
+)